@@ -1,29 +1,343 @@
 import streamlit as st
 import yfinance as yf
 import pandas as pd
+import numpy as np
 import plotly.graph_objs as go
-from plotly.subplots import make_subplots
-from datetime import datetime
+import plotly.io as pio
+import pandas_market_calendars as mcal
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+import math
+import numbers
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+# Example: Nifty 500 tickers (for demo, replace with all tickers in production)
+nifty500 = ("RELIANCE.NS", "TCS.NS", "INFY.NS", "HDFCBANK.NS", "ICICIBANK.NS", "HINDUNILVR.NS")  # tuple: hashable cache key, no per-rerun conversion
+
+# Display-grade precision is plenty for charts and moving averages
+PRICE_DTYPES = {c: np.float32 for c in ("Open", "High", "Low", "Close")}
+
+CACHE_DIR = Path(".cache")  # survives Streamlit restarts, unlike st.cache_data
+
+UNITS = ("", "K", "M", "B", "T")
+
+# The only .info fields the header and KPI row read (plus the summary, pre-trimmed)
+INFO_FIELDS = ("logo_url", "shortName", "marketCap", "trailingPE", "dividendYield", "beta")
+
+# Lookback of each yfinance period string, for trimming incrementally updated history
+PERIOD_OFFSETS = {
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+}
+
+BULK_CHUNK = 20  # Yahoo serves ~20 symbols per download request
+
+# Cache lifetimes (seconds) per data type; all price history here is daily bars
+HISTORY_TTL = 6 * 3600
+CLOSE_SETTLE = 3600  # time after the close for Yahoo to finalise the day's bar
+# Bars are split/dividend adjusted, so corporate actions rewrite the past; incremental
+# tails are only stitched onto a copy whose full download is younger than this
+FULL_HISTORY_TTL = 24 * 3600
+INFO_TTL = 6 * 3600
+FINANCIALS_TTL = 24 * 3600
+NEWS_TTL = 10 * 60
+MISSING_TTL = 5 * 60  # a symbol Yahoo returned no bars for is shown empty this long before a retry
+NEWS_MEMO_TTL = 60  # in-memory layer over the news disk cache; short so it can't pin a stale copy
+
+pio.json.config.default_engine = "orjson"
 
 # -------------------------------
 # Helper Functions
 # -------------------------------
+@lru_cache(maxsize=1024)
 def human_readable(num):
-    if num is None: return "—"
-    for unit in ["", "K", "M", "B", "T"]:
-        if abs(num) < 1000.0:
-            return f"{num:3.1f}{unit}"
-        num /= 1000.0
-    return f"{num:.1f}T"
+    if not isinstance(num, numbers.Real) or not math.isfinite(num): return "—"  # None, strings, NaN, inf
+    idx = min(int(math.log10(abs(num)) // 3), len(UNITS) - 1) if abs(num) >= 1 else 0
+    return f"{num / 1000 ** idx:3.1f}{UNITS[idx]}"
 
+def disk_age(key):
+    """Seconds since key was last stored, inf if it never was"""
+    try:
+        return time.time() - (CACHE_DIR / f"{key}.pkl").stat().st_mtime
+    except OSError:
+        return math.inf
+
+def disk_load(key, ttl=None):
+    """Cached value for key, or None if missing, unreadable or older than ttl seconds"""
+    if ttl is not None and disk_age(key) > ttl:
+        return None
+    path = CACHE_DIR / f"{key}.pkl"
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except OSError:
+        return None
+    except Exception:
+        # Corrupt, or pickled under other numpy/pandas versions (ModuleNotFoundError,
+        # AttributeError, ...): a miss, and the file is dropped so it gets rewritten
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return None
+
+def disk_store(key, value):
+    """Atomically persist value under key. Best effort: an unwritable cache dir
+    (read-only, full disk) just means the caller's in-memory value isn't saved"""
+    tmp = None
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix=".tmp", delete=False) as f:
+            tmp = f.name
+            pickle.dump(value, f)
+        os.replace(tmp, CACHE_DIR / f"{key}.pkl")
+    except OSError:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+def disk_touch(key):
+    """Record that key happened now, with no value: an empty marker whose mtime
+    (read through disk_age) is the whole point; never disk_load it"""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        (CACHE_DIR / f"{key}.pkl").touch()
+    except OSError:
+        pass
+
+def disk_cached_swr(key, ttl, loader):
+    """loader() result cached on disk; once older than ttl the old copy is still served
+    while a background thread refreshes it"""
+    cached = disk_load(key)
+    if cached is None:
+        cached = loader()
+        disk_store(key, cached)
+    elif disk_age(key) > ttl:
+        try:
+            os.utime(CACHE_DIR / f"{key}.pkl")  # claim the refresh so other reruns don't start one too
+        except OSError:
+            pass
+
+        def refresh():
+            try:
+                disk_store(key, loader())
+            except Exception:
+                pass  # keep serving the old copy
+
+        threading.Thread(target=refresh, daemon=True).start()
+    return cached
+
+# yfinance memoises info and statements on the Ticker object, so the shared
+# instance must not outlive the shortest of those cache lifetimes
+@st.cache_resource(ttl=INFO_TTL)
+def get_ticker(symbol):
+    """One yf.Ticker per symbol, shared across reruns and tabs"""
+    return yf.Ticker(symbol)
+
+@st.cache_data(ttl=NEWS_MEMO_TTL)
 def get_news(ticker):
-    """Fetch latest news using Yahoo Finance API"""
+    """Fetch latest news using Yahoo Finance API. Errors propagate so that a failed
+    fetch isn't cached; the News tab handles them"""
+    # A fresh Ticker each time: the shared one memoises .news and would never see new stories
+    return disk_cached_swr(f"news_{ticker}", NEWS_TTL, lambda: yf.Ticker(ticker).news[:5])
+
+@st.cache_data(ttl=INFO_TTL)
+def fetch_info(symbol):
+    """Company profile and key stats, trimmed to what the header shows"""
+    out = disk_load(f"info_{symbol}", INFO_TTL)
+    if out is None:
+        info = get_ticker(symbol).info
+        out = {k: info[k] for k in INFO_FIELDS if k in info}
+        out["summary"] = info.get("longBusinessSummary", "No summary available.")[:250] + "..."
+        disk_store(f"info_{symbol}", out)
+    return out
+
+@lru_cache(maxsize=1)
+def nse_schedule(day):
+    """NSE sessions of the ten days up to day; computed once per day, not per rerun"""
+    return mcal.get_calendar("NSE").schedule(start_date=pd.Timestamp(day) - pd.Timedelta(days=10), end_date=day)
+
+def history_max_age():
+    """How old a disk copy of daily bars may be. Anything saved after the last NSE
+    close has settled is final until the next session, so it stays fresh even past
+    HISTORY_TTL (overnight, weekends, holidays); once a session opens, nothing saved
+    before it counts"""
+    now = pd.Timestamp.now(tz="UTC")
+    sched = nse_schedule(now.date())
+    closes = sched["market_close"][sched["market_close"] <= now]
+    opens = sched["market_open"][sched["market_open"] <= now]
+    if closes.empty or opens.iloc[-1] > closes.iloc[-1]:  # a session is underway
+        return HISTORY_TTL if opens.empty else min(HISTORY_TTL, (now - opens.iloc[-1]).total_seconds())
+    return max(HISTORY_TTL, (now - closes.iloc[-1]).total_seconds() - CLOSE_SETTLE)
+
+def history_epoch():
+    """Changes whenever bars held in memory may have gone stale: at each NSE open, once
+    each close has settled, and every HISTORY_TTL in between. Passed as a cache key"""
+    now = pd.Timestamp.now(tz="UTC")
+    sched = nse_schedule(now.date())
+    marks = pd.concat([sched["market_open"], sched["market_close"] + pd.Timedelta(seconds=CLOSE_SETTLE)])
+    marks = marks[marks <= now]
+    anchor = marks.max() if not marks.empty else now.normalize()
+    return anchor, int((now - anchor).total_seconds() // HISTORY_TTL)
+
+def download_batch(symbols, **kwargs):
+    """yf.download in 20-symbol batches, split into one frame per symbol. Symbols Yahoo
+    had no bars for (all-NaN columns) are left out rather than returned empty, as are
+    those of a batch whose request raised; the latter are also returned as a list"""
+    frames, errored = {}, []
+    for i in range(0, len(symbols), BULK_CHUNK):
+        chunk = symbols[i:i + BULK_CHUNK]
+        try:
+            data = yf.download(" ".join(chunk), group_by="ticker", threads=True, progress=False, **kwargs)
+        except Exception:
+            errored += chunk
+            continue
+        for sym in chunk:
+            if sym in data.columns.get_level_values(0):
+                hist = data[sym].dropna(how="all")
+                if not hist.empty:
+                    frames[sym] = hist[hist.index.dayofweek < 5].astype(PRICE_DTYPES)  # remove weekends
+    return frames, errored
+
+# cache_resource: the frames are only ever read, so reruns share one dict instead of
+# each unpickling a copy of the whole universe. epoch (see history_epoch) is only a
+# cache key, so the dict is rebuilt from disk at the next open rather than kept 6h
+@st.cache_resource(ttl=HISTORY_TTL, max_entries=2)
+def fetch_price_history_bulk(symbols, period="1y", epoch=None):
+    """Price history for many symbols, from disk where possible and batched downloads otherwise"""
+    frames, stale = {}, {}
+    max_age = history_max_age()
+    for sym in symbols:
+        key = f"history_{period}_{sym}"
+        cached = disk_load(key, max_age)
+        if cached is not None:
+            frames[sym] = cached
+        elif (period in PERIOD_OFFSETS and disk_age(f"{key}_full") <= FULL_HISTORY_TTL
+              and (cached := disk_load(key)) is not None):
+            stale[sym] = cached
+
+    missing = [sym for sym in symbols if sym not in frames and sym not in stale]
+    fetched, errored = download_batch(missing, period=period)
+    for sym in missing:
+        if sym in fetched:
+            disk_touch(f"history_{period}_{sym}_full")  # the marker's mtime is the full download time
+        elif sym not in errored:
+            disk_touch(f"history_{period}_{sym}_failed")  # Yahoo answered, but with no bars
+    if stale:
+        # Stale copies only need the bars since their last one; the last bar is refetched
+        # in case it was still forming, then the window is trimmed back to the period.
+        # A symbol whose tail failed is absent here, so its copy keeps the old mtime
+        # and is retried on the next run instead of passing for fresh
+        start = min(hist.index[-1] for hist in stale.values())
+        for sym, tail in download_batch(list(stale), start=start)[0].items():
+            merged = pd.concat([stale[sym], tail])
+            merged = merged[~merged.index.duplicated(keep="last")]
+            fetched[sym] = merged[merged.index >= merged.index[-1] - PERIOD_OFFSETS[period]]
+
+    for sym, hist in fetched.items():
+        disk_store(f"history_{period}_{sym}", hist)
+    # A stale copy still beats nothing if its tail download failed
+    frames.update({**stale, **fetched})
+    return frames
+
+@st.cache_data(ttl=FINANCIALS_TTL)
+def fetch_financials(symbol):
+    """Fetch income statement, balance sheet and cashflow concurrently (metrics as rows)"""
+    t = get_ticker(symbol)
+
+    def load(attr):
+        # yfinance hands back object columns; make them plain float32 once, before caching
+        return getattr(t, attr).apply(pd.to_numeric, errors="coerce").astype(np.float32)
+
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        futs = [ex.submit(load, a) for a in ("financials", "balance_sheet", "cashflow")]
+        return tuple(f.result() for f in futs)
+
+def compute_smas(close, windows):
+    """SMA arrays keyed by window, all from one cumulative sum over close"""
+    close = np.asarray(close, dtype=np.float64)
+    csum = np.concatenate(([0.0], np.cumsum(close)))
+    out = {}
+    for w in windows:
+        sma = np.full(len(close), np.nan, dtype=np.float32)  # summed in float64, shipped as float32
+        if len(close) >= w:
+            sma[w - 1:] = (csum[w:] - csum[:-w]) / w
+        out[w] = sma
+    return out
+
+@st.cache_data(ttl=MISSING_TTL)
+def fetch_missing_history(symbol):
+    """One year of bars for a symbol the bulk result lacks. A symbol Yahoo just answered
+    with no bars stays empty until its MISSING_TTL is up rather than being asked again;
+    Ticker.history is the fallback after a batch request raised, and for later retries.
+    Empty results are cached too, so a failing symbol costs one request per MISSING_TTL"""
+    key = f"history_1y_{symbol}"
+    empty = pd.DataFrame(columns=list(PRICE_DTYPES))
+    if disk_age(f"{key}_failed") <= MISSING_TTL:
+        return empty
+    if (hist := disk_load(key, history_max_age())) is not None:
+        return hist  # a retry that already succeeded
     try:
-        stock = yf.Ticker(ticker)
-        news_items = stock.news[:5] if hasattr(stock, "news") else []
-        return news_items
-    except:
-        return []
+        hist = get_ticker(symbol).history(period="1y")
+    except Exception:
+        return empty
+    if hist.empty:
+        return empty
+    hist = hist[hist.index.dayofweek < 5].astype(PRICE_DTYPES)
+    disk_store(key, hist)
+    disk_touch(f"{key}_full")
+    return hist
+
+def fetch_price_history(symbol, period="1y"):
+    """Price history for one symbol, sliced out of the batched one-year universe download"""
+    hist = fetch_price_history_bulk(nifty500, "1y", history_epoch()).get(symbol)
+    if hist is None:
+        hist = fetch_missing_history(symbol)
+    if period != "1y" and not hist.empty:
+        # Shorter timeframes are cut from the cached year rather than downloaded again
+        hist = hist[hist.index >= hist.index[-1] - PERIOD_OFFSETS[period]]
+    return hist
+
+# cache_resource hands back the same Figure without unpickling it on every rerun;
+# st.plotly_chart only reads it, and unlike a dict a Figure isn't re-validated there.
+# Keyed on the bars themselves, so refreshed history never meets an old figure
+@st.cache_resource(ttl=HISTORY_TTL)
+def build_chart_figure(hist, windows):
+    """Candlestick chart with SMA overlays, built once per (bars, windows)"""
+    smas = compute_smas(hist["Close"].to_numpy(), windows)
+    idx = hist.index.to_numpy()
+
+    traces = [go.Candlestick(x=idx,
+                             open=hist["Open"].to_numpy(), high=hist["High"].to_numpy(),
+                             low=hist["Low"].to_numpy(), close=hist["Close"].to_numpy(),
+                             name="Candlestick")]
+    # WebGL lines keep zoom/pan smooth; candlesticks have no GL variant
+    traces += [go.Scattergl(x=idx, y=smas[w], mode="lines", name=f"SMA{w}") for w in windows]
+
+    # Handing all traces to the constructor validates them in one pass
+    fig = go.Figure(data=traces, layout=go.Layout(xaxis_rangeslider_visible=True))
+    return fig
+
+@st.fragment
+def price_chart(symbol, timeframes, indicator_options):
+    """Chart controls plus chart; changing a control reruns only this fragment"""
+    period = st.selectbox("Timeframe:", timeframes) if len(timeframes) > 1 else timeframes[0]
+    selected = st.multiselect("Indicators:", indicator_options, default=[])
+    windows = tuple(sorted(int(opt[3:]) for opt in selected))  # click order must not split the cache or reorder the legend
+    hist = fetch_price_history(symbol, period)
+    if hist.empty:
+        st.warning("No price data available.")
+        return
+    st.plotly_chart(build_chart_figure(hist, windows), use_container_width=True)
 
 # -------------------------------
 # Streamlit UI
@@ -31,13 +345,12 @@ def get_news(ticker):
 st.set_page_config(page_title="Stock Monitoring Platform", layout="wide")
 st.markdown("<h1 style='text-align: center;'>📈 Stock Monitoring Platform</h1>", unsafe_allow_html=True)
 
-# Example: Nifty 500 tickers (for demo, replace with all tickers in production)
-nifty500 = ["RELIANCE.NS", "TCS.NS", "INFY.NS", "HDFCBANK.NS", "ICICIBANK.NS", "HINDUNILVR.NS"]
+# Warm the price cache for the whole universe with one batched download
+fetch_price_history_bulk(nifty500, "1y", history_epoch())
 
-ticker = st.selectbox("Select Stock:", nifty500)
+ticker = st.selectbox("Select Stock:", nifty500, key="stock_sel")
 
-stock = yf.Ticker(ticker)
-info = stock.info
+info = fetch_info(ticker)
 
 # -------------------------------
 # Company Info
@@ -48,16 +361,16 @@ with col1:
         st.image(info["logo_url"], width=80)
 with col2:
     st.subheader(info.get("shortName", ticker))
-    st.markdown(info.get("longBusinessSummary", "No summary available.")[:250] + "...")
+    st.markdown(info["summary"])
 
 # -------------------------------
 # KPIs
 # -------------------------------
 col1, col2, col3, col4 = st.columns(4)
 col1.metric("Market Cap", human_readable(info.get("marketCap")))
-col2.metric("P/E Ratio", round(info.get("trailingPE", 0), 2))
-col3.metric("Dividend Yield", f"{round(info.get('dividendYield',0)*100,2)}%")
-col4.metric("Beta", round(info.get("beta", 0), 2))
+col2.metric("P/E Ratio", f"{info.get('trailingPE', 0):.2f}")
+col3.metric("Dividend Yield", f"{info.get('dividendYield', 0)*100:.2f}%")
+col4.metric("Beta", f"{info.get('beta', 0):.2f}")
 
 # -------------------------------
 # Tabs
@@ -69,25 +382,7 @@ tab = st.radio("Sections:", ["Overview", "Financials", "Technicals", "News"], ho
 # -------------------------------
 if tab == "Overview":
     st.subheader("📊 Stock Price History")
-    hist = stock.history(period="1y")
-    hist = hist[hist.index.dayofweek < 5]  # remove weekends
-
-    fig = go.Figure()
-    fig.add_trace(go.Candlestick(x=hist.index,
-                                 open=hist["Open"], high=hist["High"],
-                                 low=hist["Low"], close=hist["Close"],
-                                 name="Candlestick"))
-
-    sma_options = st.multiselect("Indicators:", ["SMA20","SMA50"], default=[])
-    if "SMA20" in sma_options:
-        hist["SMA20"] = hist["Close"].rolling(20).mean()
-        fig.add_trace(go.Scatter(x=hist.index, y=hist["SMA20"], mode="lines", name="SMA20"))
-    if "SMA50" in sma_options:
-        hist["SMA50"] = hist["Close"].rolling(50).mean()
-        fig.add_trace(go.Scatter(x=hist.index, y=hist["SMA50"], mode="lines", name="SMA50"))
-
-    fig.update_layout(xaxis_rangeslider_visible=True)
-    st.plotly_chart(fig, use_container_width=True)
+    price_chart(ticker, ["1y"], ["SMA20","SMA50"])
 
 # -------------------------------
 # Financials Tab
@@ -95,46 +390,38 @@ if tab == "Overview":
 elif tab == "Financials":
     st.subheader("📊 Financials Overview")
 
-    fin = stock.financials.T
+    fin, bal, cf = fetch_financials(ticker)
     if not fin.empty:
         st.markdown("### Income Statement Waterfall")
         # Use waterfall chart for Revenue → Expenses → Net Income
-        rev = fin.get("Total Revenue")
-        net = fin.get("Net Income")
+        rev = fin.loc["Total Revenue"] if "Total Revenue" in fin.index else None
+        net = fin.loc["Net Income"] if "Net Income" in fin.index else None
         if rev is not None and net is not None:
             fig = go.Figure(go.Waterfall(
-                x=rev.index,
+                x=rev.index.to_numpy(),
                 measure=["relative"]*len(rev),
-                y=rev.values,
+                y=rev.to_numpy(),
                 name="Revenue"
             ))
             st.plotly_chart(fig, use_container_width=True)
 
-        metrics_options = st.multiselect("Select metrics to visualize:", fin.columns.tolist(), default=["Total Revenue","Net Income"])
-        fig2 = go.Figure()
-        for metric in metrics_options:
-            if metric in fin.columns:
-                fig2.add_trace(go.Bar(x=fin.index, y=fin[metric], name=metric))
+        metrics_options = st.multiselect("Select metrics to visualize:", fin.index.tolist(), default=["Total Revenue","Net Income"])
+        fig2 = go.Figure(data=[go.Bar(x=fin.columns.to_numpy(), y=fin.loc[metric].to_numpy(), name=metric)
+                               for metric in metrics_options if metric in fin.index])
         st.plotly_chart(fig2, use_container_width=True)
 
-    bal = stock.balance_sheet.T
     if not bal.empty:
         st.markdown("### Balance Sheet")
-        metrics_bal = st.multiselect("Balance Sheet Metrics:", bal.columns.tolist(), default=["Total Assets","Total Liab"])
-        fig3 = go.Figure()
-        for metric in metrics_bal:
-            if metric in bal.columns:
-                fig3.add_trace(go.Bar(x=bal.index, y=bal[metric], name=metric))
+        metrics_bal = st.multiselect("Balance Sheet Metrics:", bal.index.tolist(), default=["Total Assets","Total Liab"])
+        fig3 = go.Figure(data=[go.Bar(x=bal.columns.to_numpy(), y=bal.loc[metric].to_numpy(), name=metric)
+                               for metric in metrics_bal if metric in bal.index])
         st.plotly_chart(fig3, use_container_width=True)
 
-    cf = stock.cashflow.T
     if not cf.empty:
         st.markdown("### Cashflow")
-        metrics_cf = st.multiselect("Cashflow Metrics:", cf.columns.tolist(), default=["Total Cash From Operating Activities"])
-        fig4 = go.Figure()
-        for metric in metrics_cf:
-            if metric in cf.columns:
-                fig4.add_trace(go.Bar(x=cf.index, y=cf[metric], name=metric))
+        metrics_cf = st.multiselect("Cashflow Metrics:", cf.index.tolist(), default=["Total Cash From Operating Activities"])
+        fig4 = go.Figure(data=[go.Bar(x=cf.columns.to_numpy(), y=cf.loc[metric].to_numpy(), name=metric)
+                               for metric in metrics_cf if metric in cf.index])
         st.plotly_chart(fig4, use_container_width=True)
 
 # -------------------------------
@@ -142,33 +429,17 @@ elif tab == "Financials":
 # -------------------------------
 elif tab == "Technicals":
     st.subheader("📈 Technical Analysis")
-    hist = stock.history(period="1y")
-    hist = hist[hist.index.dayofweek < 5]
-
-    timeframe = st.selectbox("Timeframe:", ["1y","6mo","3mo","1mo"])
-    hist = stock.history(period=timeframe)
-    hist = hist[hist.index.dayofweek < 5]
-
-    fig = go.Figure()
-    fig.add_trace(go.Candlestick(x=hist.index,
-                                 open=hist["Open"], high=hist["High"],
-                                 low=hist["Low"], close=hist["Close"],
-                                 name="Candlestick"))
-
-    indicators = st.multiselect("Indicators:", ["SMA20","SMA50","SMA100"])
-    if "SMA20" in indicators: hist["SMA20"] = hist["Close"].rolling(20).mean(); fig.add_trace(go.Scatter(x=hist.index, y=hist["SMA20"], mode="lines", name="SMA20"))
-    if "SMA50" in indicators: hist["SMA50"] = hist["Close"].rolling(50).mean(); fig.add_trace(go.Scatter(x=hist.index, y=hist["SMA50"], mode="lines", name="SMA50"))
-    if "SMA100" in indicators: hist["SMA100"] = hist["Close"].rolling(100).mean(); fig.add_trace(go.Scatter(x=hist.index, y=hist["SMA100"], mode="lines", name="SMA100"))
-
-    fig.update_layout(xaxis_rangeslider_visible=True)
-    st.plotly_chart(fig, use_container_width=True)
+    price_chart(ticker, ["1y","6mo","3mo","1mo"], ["SMA20","SMA50","SMA100"])
 
 # -------------------------------
 # News Tab
 # -------------------------------
 elif tab == "News":
     st.subheader("📰 Latest News")
-    news_items = get_news(ticker)
+    try:
+        news_items = get_news(ticker)
+    except Exception:
+        news_items = []
     if news_items:
         for item in news_items:
             col1, col2 = st.columns([1,5])
@@ -177,7 +448,9 @@ elif tab == "News":
                     img = item["thumbnail"]["resolutions"][0]["url"]
                     st.image(img, width=80)
             with col2:
-                st.markdown(f"**[{item.get('title','No title')}]({item.get('link','#')})**")
-                st.caption(item.get("publisher", ""))
+                # Title and publisher in one element: one delta per item instead of two
+                publisher = item.get("publisher", "")
+                st.markdown(f"**[{item.get('title','No title')}]({item.get('link','#')})**"
+                            + (f"  \n:gray[{publisher}]" if publisher else ""))
     else:
         st.info("No news available.")